@@ -3,9 +3,10 @@
 main.py — Option Chain poller (debug-friendly)
 
 Features:
-- Does NOT use telegram.ext Application/Updater to avoid compatibility errors.
-- Uses telegram.Bot (async) to send messages.
-- Optional dhanhq client; falls back to HTTP placeholder.
+- Does NOT use python-telegram-bot; messages go straight to the Bot API sendMessage
+  endpoint over the shared aiohttp session.
+- Optional dhanhq client; falls back to HTTP placeholder (aiohttp, shared session).
+- Uses orjson for JSON work when installed (stdlib json otherwise).
 - Very verbose get_ltp() which deep-searches responses for numeric LTP-like values.
 - Graceful shutdown via SIGINT/SIGTERM.
 """
@@ -15,8 +16,14 @@ import asyncio
 import logging
 import signal
 import json
-from datetime import datetime
-import requests
+import time
+import functools
+import html
+import random
+from collections import deque
+from itertools import islice
+from datetime import date, datetime
+import aiohttp
 
 # Try optional dhanhq import
 try:
@@ -25,8 +32,21 @@ try:
 except Exception:
     _HAS_DHANHQ = False
 
-# telegram Bot (async)
-from telegram import Bot  # python-telegram-bot must be installed
+# Optional orjson for faster (de)serialization; stdlib json otherwise
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+if _HAS_ORJSON:
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, default=str)
+    _loads = json.loads
 
 # Config / env
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -42,7 +62,43 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "").strip()
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "").strip()
 
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "60"))
+if POLL_INTERVAL <= 0:
+    logger.warning("POLL_INTERVAL=%s is not positive; using 60s.", POLL_INTERVAL)
+    POLL_INTERVAL = 60
 STRIKE_WINDOW = int(os.getenv("STRIKE_WINDOW", "5"))
+# Batched option quotes (Dhan v2 market quote: {segment: [security_id, ...]})
+DHAN_QUOTE_URL = os.getenv("DHAN_QUOTE_URL", "https://api.dhan.co/v2/marketfeed/quote")
+OPTION_EXCHANGE = os.getenv("OPTION_EXCHANGE", "NSE_FNO")
+# Seconds a fetched LTP (or a miss) is reused for the same security
+LTP_CACHE_TTL = float(os.getenv("LTP_CACHE_TTL", "1.0"))
+# Seconds an idle pooled HTTP connection is kept (aiohttp default 15s would drop it between polls)
+HTTP_KEEPALIVE = float(os.getenv("HTTP_KEEPALIVE", str(POLL_INTERVAL + 15)))
+# Upper bound (s) for the per-symbol retry backoff after failed fetches
+BACKOFF_MAX = float(os.getenv("BACKOFF_MAX", "600"))
+# Outgoing Telegram pacing: bot-wide sends/sec, and Telegram's max message length
+TELEGRAM_MAX_RATE = float(os.getenv("TELEGRAM_MAX_RATE", "30"))
+if TELEGRAM_MAX_RATE <= 0:
+    logger.warning("TELEGRAM_MAX_RATE=%s is not positive; using 30/s.", TELEGRAM_MAX_RATE)
+    TELEGRAM_MAX_RATE = 30.0
+TELEGRAM_MAX_MESSAGE_LEN = 4096
+# Seconds stop() waits for queued Telegram messages to go out before cancelling the sender
+TELEGRAM_DRAIN_TIMEOUT = 10.0
+# Option chain row templates are reused while the ATM strike is unchanged; dropped after this many seconds unused
+CHAIN_CACHE_TTL = float(os.getenv("CHAIN_CACHE_TTL", str(POLL_INTERVAL * 5)))
+
+# Strike spacing per symbol (INSTRUMENTS keys); anything else uses the default
+_DEFAULT_STRIKE_INTERVAL = 50
+_STRIKE_INTERVALS = {"NIFTY50": 50, "TCS": 50}
+
+# Known LTP containers/keys in quote responses, tried before any deep search
+_LTP_KEYS = ("LTP", "ltp", "lastPrice", "last_traded_price", "lastTradedPrice", "last")
+_LTP_CONTAINERS = ("data", "result", "response", "payload")
+_LTP_NESTED = ("quote", "market")
+# case-folded, de-duplicated, still in _LTP_KEYS priority order
+_LTP_KEYS_FOLDED = tuple(dict.fromkeys(k.lower() for k in _LTP_KEYS))
+
+# Key substrings that mark a numeric field as a possible LTP during deep search
+_LTP_KEY_SUBSTRINGS = ("ltp", "last", "price", "lt")
 
 # Instrument placeholders (use your real security ids from Dhan instruments)
 INSTRUMENTS = {
@@ -65,56 +121,224 @@ else:
     else:
         logger.info("DHAN credentials missing — dhanhq client not initialized.")
 
-# Telegram Bot object (async)
+# Deliver updates without a notification sound (periodic chain snapshots, not alerts)
+TELEGRAM_SILENT = os.getenv("TELEGRAM_SILENT", "1").strip().lower() in ("1", "true", "yes")
+
+# Telegram Bot API endpoint (send-only; never log it, it embeds the token)
 if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
     logger.warning("TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID not set — Telegram sends will be skipped.")
-bot = Bot(token=TELEGRAM_BOT_TOKEN) if TELEGRAM_BOT_TOKEN else None
+_TELEGRAM_SEND_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage" if TELEGRAM_BOT_TOKEN else None
+
+class _TelegramError(Exception):
+    pass
+
+class _TelegramRetryAfter(_TelegramError):
+    def __init__(self, retry_after):
+        super().__init__(f"flood control, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+# Shared aiohttp session (created lazily, reused across polls)
+_http_session: aiohttp.ClientSession | None = None
+
+async def get_session():
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        # DNS answers cached for 5 min (aiohttp default is 10s) so steady polling skips lookups;
+        # idle connections kept past one poll interval so each cycle reuses a warm TLS connection
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=HTTP_KEEPALIVE,
+            enable_cleanup_closed=True,
+        )
+        timeout = aiohttp.ClientTimeout(total=12, connect=5)
+        # json= bodies (Telegram sends, batched option quotes) serialized with orjson when available
+        _http_session = aiohttp.ClientSession(connector=connector, timeout=timeout, json_serialize=_dumps)
+    return _http_session
+
+async def close_session():
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+# Static pieces of the Telegram option chain message; everything above the first row is one template
+_DIVIDER = "━" * 20 + "\n\n"
+_TABLE_HEADER = f"{'Strike':>7} {'CE LTP':>10} {'PE LTP':>10}\n"
+_TABLE_SEP = "-" * 35 + "\n"
+_HEADER_TEMPLATE = (
+    "🔔 <b>{symbol} Option Chain Update</b>\n📊 <b>Spot Price:</b> ₹{spot:.2f}\n⏰ <b>Time:</b> {ts}\n"
+    + _DIVIDER + "<pre>" + _TABLE_HEADER + _TABLE_SEP
+).format
+_ROW_FMT = "{marker}{strike:7d} {ce:10.2f} {pe:10.2f}\n".format
+
+def _to_float(v):
+    """Coerce an int/float/numeric string (commas allowed) to float; None if not numeric."""
+    if v is None or v == "" or isinstance(v, bool):
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str):
+        try:
+            return float(v.replace(",", "").strip())
+        except ValueError:
+            return None
+    return None
+
+def _match_ltp_key(body):
+    """Return the numeric value of the highest-priority LTP key present (case-insensitive), or None."""
+    # fold keys once per body, then probe in priority order so e.g. "ltp" beats a leading "last"
+    folded = {k.lower(): v for k, v in body.items() if isinstance(k, str)}
+    for key in _LTP_KEYS_FOLDED:
+        val = _to_float(folded.get(key))
+        if val is not None:
+            return val
+    return None
+
+def _extract_ltp(body):
+    """LTP from body itself, else from a nested quote/market object one level down."""
+    val = _match_ltp_key(body)
+    if val is not None:
+        return val
+    for name in _LTP_NESTED:
+        sub = body.get(name)
+        if isinstance(sub, dict):
+            val = _match_ltp_key(sub)
+            if val is not None:
+                return val
+    return None
+
+def _ltp_from_known_paths(resp):
+    """Check each known container (data/result/...) and then the root for an LTP key."""
+    if not isinstance(resp, dict):
+        return None
+    for name in _LTP_CONTAINERS:
+        body = resp.get(name)
+        if isinstance(body, dict):
+            val = _extract_ltp(body)
+            if val is not None:
+                logger.debug("Found LTP in %s => %s", name, val)
+                return val
+    val = _extract_ltp(resp)
+    if val is not None:
+        logger.debug("Found LTP in root => %s", val)
+    return val
+
+@functools.lru_cache(maxsize=64)
+def _get_expiry_cached(symbol: str, day: date) -> str:
+    # Placeholder; replace with proper expiry resolution (cached per symbol per trading day)
+    return os.getenv("OPTION_EXPIRY_DEFAULT", "2025-10-03")
+
+# (symbol, strike, side, expiry) -> option security id; only resolved ids are stored, so a miss
+# (instrument master still loading, contract listed later) is retried on the next lookup
+_option_sid_cache: dict[tuple, str] = {}
+
+def _resolve_option_security_id(symbol: str, strike: int, side: str, expiry: str):
+    # Placeholder; resolve from the Dhan instrument master. Always None for now.
+    return None
+
+def _get_option_security_id(symbol: str, strike: int, side: str, expiry: str):
+    key = (symbol, strike, side, expiry)
+    sid = _option_sid_cache.get(key)
+    if sid is None:
+        sid = _resolve_option_security_id(symbol, strike, side, expiry)
+        if sid is not None:
+            # a contract's id never changes, so resolved ids are kept indefinitely
+            _option_sid_cache[key] = sid
+    return sid
 
 def current_ts():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 def random_jitter():
-    # small jitter (0..1s)
-    try:
-        return float(os.urandom(1)[0]) / 255.0
-    except Exception:
-        return 0.0
+    # small jitter (0..1s); userspace PRNG, no need for os.urandom's syscall/crypto strength
+    return random.random()
 
 class OptionChainBot:
     def __init__(self):
         self.running = True
         self._task = None
-
-    # deep_search helper (nested dict/list scanner)
-    def _deep_search_numeric_candidates(self, obj, path="root", depth=0, max_depth=4):
-        results = []
+        self._tg_task = None
+        # set (by signal handlers) to ask main() to shut the bot down
+        self._stop_requested = asyncio.Event()
+        # symbol -> current backoff (s) / monotonic time before which the symbol is skipped
+        self._backoff: dict[str, float] = {}
+        self._next_try: dict[str, float] = {}
+        # symbol -> hash of the last chain delivered (set by _tg_worker), to skip identical updates
+        self._last_msg_hash: dict[str, int] = {}
+        self._tg_queue: asyncio.Queue = asyncio.Queue()
+        # invariant sendMessage fields, built once
+        self._send_kwargs = {
+            "chat_id": TELEGRAM_CHAT_ID,
+            "parse_mode": "HTML",
+            "disable_web_page_preview": True,
+            "disable_notification": TELEGRAM_SILENT,
+        }
+        # (security_id, exchange) -> (expires_at_monotonic, ltp or None)
+        self._ltp_cache: dict[tuple, tuple[float, float | None]] = {}
+        # (security_id, exchange) -> future of the fetch currently in flight
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # (symbol, atm, expiry) -> (expires_at_monotonic, rows)
+        self._chain_cache: dict[tuple, tuple[float, list]] = {}
+
+    # deep_search helper (nested dict/list scanner, iterative breadth-first walk).
+    # Yields (path, value) lazily so callers can stop at the first plausible hit.
+    def _iter_numeric_ltp_candidates(self, obj, path="root", depth=0, max_depth=4):
         if depth > max_depth or obj is None:
-            return results
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                # direct numeric match
-                if isinstance(v, (int, float)):
-                    if ("ltp" in k.lower()) or ("last" in k.lower()) or ("price" in k.lower()) or ("lt" in k.lower()):
-                        results.append((f"{path}.{k}", v))
-                # numeric string
-                if isinstance(v, str):
-                    s = v.replace(",", "").strip()
-                    try:
-                        f = float(s)
-                        if ("ltp" in k.lower()) or ("last" in k.lower()) or ("price" in k.lower()) or ("lt" in k.lower()):
-                            results.append((f"{path}.{k}", f))
-                    except:
-                        pass
-                # recurse
-                results.extend(self._deep_search_numeric_candidates(v, f"{path}.{k}", depth+1, max_depth))
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj[:200]):  # limit depth/length
-                results.extend(self._deep_search_numeric_candidates(item, f"{path}[{i}]", depth+1, max_depth))
-        return results
+            return
+        queue = deque([(obj, path, depth)])
+        while queue:
+            node, npath, ndepth = queue.popleft()
+            descend = ndepth < max_depth
+            if isinstance(node, dict):
+                for k, v in node.items():
+                    kl = str(k).lower()
+                    if any(sub in kl for sub in _LTP_KEY_SUBSTRINGS):
+                        # direct numeric match
+                        if isinstance(v, (int, float)):
+                            yield (f"{npath}.{k}", v)
+                        # numeric string
+                        elif isinstance(v, str):
+                            f = _to_float(v)
+                            if f is not None:
+                                yield (f"{npath}.{k}", f)
+                    # only containers can hold further matches; scalars are never queued
+                    if descend and isinstance(v, (dict, list)):
+                        queue.append((v, f"{npath}.{k}", ndepth + 1))
+            elif isinstance(node, list) and descend:
+                for i, item in enumerate(islice(node, 200)):  # limit length without copying
+                    if isinstance(item, (dict, list)):
+                        queue.append((item, f"{npath}[{i}]", ndepth + 1))
 
     async def get_ltp(self, security_id: str, exchange: str):
+        # short TTL cache: repeat reads (misses included) within LTP_CACHE_TTL skip the API
+        key = (security_id, exchange)
+        cached = self._ltp_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        # single-flight: concurrent callers for the same key share one fetch
+        fut = self._inflight.get(key)
+        if fut is not None:
+            # shield so a cancelled waiter doesn't cancel the shared future
+            return await asyncio.shield(fut)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            val = await self._fetch_ltp(security_id, exchange)
+            self._ltp_cache[key] = (time.monotonic() + LTP_CACHE_TTL, val)
+            fut.set_result(val)
+            return val
+        finally:
+            if not fut.done():
+                # fetch was cancelled: release waiters with a miss
+                fut.set_result(None)
+            self._inflight.pop(key, None)
+
+    async def _fetch_ltp(self, security_id: str, exchange: str):
         """
-        Debug get_ltp:
+        _fetch_ltp: the uncached quote fetch behind get_ltp (which adds the TTL cache
+        and single-flight sharing):
         - If dhanhq client is present, use it and log entire response.
         - Otherwise use HTTP fallback (placeholder).
         - Deep-search response for numeric keys that look like LTP.
@@ -123,54 +347,35 @@ class OptionChainBot:
             # 1) Try dhanhq client
             if dhan:
                 try:
-                    resp = dhan.get_market_quote(security_id, exchange)
+                    # dhanhq is a blocking requests-based SDK; keep it off the event loop thread
+                    resp = await asyncio.to_thread(dhan.get_market_quote, security_id, exchange)
                 except Exception as e:
                     logger.exception("dhan.get_market_quote raised an exception")
                     resp = None
 
-                # Log full response (trim to avoid massive output)
-                try:
-                    rep = json.dumps(resp, default=str, indent=2) if not isinstance(resp, str) else resp
-                except Exception:
-                    rep = repr(resp)
-                logger.debug("=== DHANHQ RAW RESPONSE START ===\n%s\n=== DHANHQ RAW RESPONSE END ===", rep[:10000])
+                # Log full response (trim to avoid massive output); only serialize when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        rep = _dumps(resp) if not isinstance(resp, str) else resp
+                    except Exception:
+                        rep = repr(resp)
+                    logger.debug("=== DHANHQ RAW RESPONSE START ===\n%s\n=== DHANHQ RAW RESPONSE END ===", rep[:10000])
 
                 if not resp:
                     logger.debug("dhanhq returned empty/None response.")
                     return None
 
-                # Try common places and keys
-                # 1) immediate direct numeric keys
+                # fast path: known key paths, checked in priority order
+                val = _ltp_from_known_paths(resp)
+                if val is not None:
+                    return val
+
                 if isinstance(resp, dict):
-                    body_candidates = []
-                    for container in ("data", "result", "response", "payload"):
-                        if container in resp:
-                            body_candidates.append((container, resp.get(container)))
-                    body_candidates.append(("root", resp))
-
-                    # check candidates for common LTP keys
-                    for name, body in body_candidates:
-                        if isinstance(body, dict):
-                            for key in ("LTP", "ltp", "lastPrice", "last_traded_price", "lastTradedPrice", "last"):
-                                if key in body and body[key] not in (None, ""):
-                                    try:
-                                        val = float(str(body[key]).replace(",", ""))
-                                        logger.debug("Found LTP at %s.%s => %s", name, key, val)
-                                        return val
-                                    except:
-                                        pass
-
-                    # deep search for numeric candidates
-                    hits = self._deep_search_numeric_candidates(resp)
-                    if hits:
-                        logger.debug("Potential numeric hits for LTP (path -> value):")
-                        for p, v in hits[:20]:
-                            logger.debug("%s -> %s", p, v)
-                        # return first plausible hit
-                        try:
-                            return float(hits[0][1])
-                        except:
-                            pass
+                    # slow path: deep search, return first plausible hit
+                    for p, v in self._iter_numeric_ltp_candidates(resp, "root", 0, 4):
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Potential numeric hit for LTP %s -> %s", p, v)
+                        return float(v)
 
                 # If we reach here, no LTP found
                 logger.debug("No LTP located in dhanhq response for %s@%s", security_id, exchange)
@@ -183,34 +388,28 @@ class OptionChainBot:
 
             url = f"https://api.dhan.co/market/quote?security_id={security_id}&exchange={exchange}"
             headers = {"Authorization": f"Bearer {DHAN_ACCESS_TOKEN}", "Accept": "application/json"}
-            r = requests.get(url, headers=headers, timeout=12)
-            logger.debug("HTTP fallback status=%s body=%s", r.status_code, r.text[:4000])
-            r.raise_for_status()
-            j = r.json()
-            try:
-                rep = json.dumps(j, default=str, indent=2)
-            except Exception:
-                rep = repr(j)
-            logger.debug("=== HTTP FALLBACK RAW JSON START ===\n%s\n=== HTTP FALLBACK RAW JSON END ===", rep[:10000])
-
-            # direct keys
-            if isinstance(j, dict):
-                body = j.get("data") if "data" in j else j
-                if isinstance(body, dict):
-                    for key in ("LTP", "ltp", "lastPrice", "last_traded_price"):
-                        if key in body and body[key] not in (None, ""):
-                            try:
-                                return float(str(body[key]).replace(",", ""))
-                            except:
-                                pass
-            hits = self._deep_search_numeric_candidates(j)
-            if hits:
-                for p, v in hits:
+            session = await get_session()
+            async with session.get(url, headers=headers) as r:
+                if logger.isEnabledFor(logging.DEBUG):
+                    text = await r.text()
+                    logger.debug("HTTP fallback status=%s body=%s", r.status, text[:4000])
+                r.raise_for_status()
+                j = _loads(await r.read())
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    rep = _dumps(j)
+                except Exception:
+                    rep = repr(j)
+                logger.debug("=== HTTP FALLBACK RAW JSON START ===\n%s\n=== HTTP FALLBACK RAW JSON END ===", rep[:10000])
+
+            # fast path: known key paths; deep search only on a miss
+            val = _ltp_from_known_paths(j)
+            if val is not None:
+                return val
+            for p, v in self._iter_numeric_ltp_candidates(j, "root", 0, 4):
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug("HTTP fallback potential LTP %s -> %s", p, v)
-                    try:
-                        return float(v)
-                    except:
-                        pass
+                return float(v)
             return None
 
         except Exception as exc:
@@ -218,78 +417,232 @@ class OptionChainBot:
             return None
 
     def get_nearest_expiry(self, symbol: str):
-        # Placeholder; replace with proper expiry resolution
-        return os.getenv("OPTION_EXPIRY_DEFAULT", "2025-10-03")
-
-    def get_option_data(self, symbol: str, strike: int, side: str, expiry: str):
-        # Placeholder - implement strike -> option instrument mapping and real fetch
-        return {"ltp": 0.0, "oi": 0, "iv": None, "volume": 0}
+        return _get_expiry_cached(symbol, date.today())
 
-    def build_option_chain(self, symbol: str, spot_price: float):
-        interval = 50 if symbol.upper().startswith("NIFTY") else 50
+    async def get_option_data_batch(self, symbol: str, strikes, expiry: str):
+        """
+        Fetch CE/PE data for every strike in a single Dhan quote request.
+        Returns {(strike, side): {"ltp", "oi", "iv", "volume"}}; legs that cannot be
+        resolved or fetched keep placeholder zeros.
+        """
+        legs = [(strike, side) for strike in strikes for side in ("CE", "PE")]
+        result = {leg: {"ltp": 0.0, "oi": 0, "iv": None, "volume": 0} for leg in legs}
+        sids = {}
+        for strike, side in legs:
+            sid = _get_option_security_id(symbol, strike, side, expiry)
+            if sid is not None:
+                sids[str(sid)] = (strike, side)
+        # NOTE: _resolve_option_security_id is still a placeholder returning None, so today
+        # sids is always empty and the batched POST/parse below never runs.
+        if not sids or not DHAN_ACCESS_TOKEN:
+            return result
+
+        payload = {OPTION_EXCHANGE: [int(sid) for sid in sids]}
+        headers = {"access-token": DHAN_ACCESS_TOKEN, "client-id": DHAN_CLIENT_ID, "Accept": "application/json"}
+        try:
+            session = await get_session()
+            async with session.post(DHAN_QUOTE_URL, json=payload, headers=headers) as r:
+                r.raise_for_status()
+                j = _loads(await r.read())
+        except Exception as e:
+            logger.warning("%s: option quote batch failed: %s", symbol, e)
+            return result
+
+        data = j.get("data") if isinstance(j, dict) else None
+        quotes = (data if isinstance(data, dict) else {}).get(OPTION_EXCHANGE) or {}
+        for sid, leg in sids.items():
+            q = quotes.get(sid)
+            if isinstance(q, dict):
+                result[leg] = {
+                    "ltp": _to_float(q.get("last_price")) or 0.0,
+                    "oi": q.get("oi", 0),
+                    "iv": None,
+                    "volume": q.get("volume", 0),
+                }
+        return result
+
+    async def build_option_chain(self, symbol: str, spot_price: float):
+        interval = _STRIKE_INTERVALS.get(symbol, _DEFAULT_STRIKE_INTERVAL)
         atm = round(spot_price / interval) * interval
         expiry = self.get_nearest_expiry(symbol)
-        rows = []
-        for i in range(-STRIKE_WINDOW, STRIKE_WINDOW + 1):
-            strike = int(atm + i * interval)
-            ce = self.get_option_data(symbol, strike, "CE", expiry)
-            pe = self.get_option_data(symbol, strike, "PE", expiry)
-            rows.append({"strike": strike, "CE": ce, "PE": pe, "is_atm": i == 0})
+        key = (symbol, atm, expiry)
+        now = time.monotonic()
+        cached = self._chain_cache.get(key)
+        if cached and cached[0] > now:
+            # same ATM/expiry as a recent cycle: reuse the rows, refresh only option data
+            rows = cached[1]
+        else:
+            # drop templates nobody has used recently
+            for k in [k for k, (exp, _) in self._chain_cache.items() if exp <= now]:
+                del self._chain_cache[k]
+            # strikes generated by range() in C; no per-strike multiply/int() in Python
+            strikes = range(atm - STRIKE_WINDOW * interval, atm + (STRIKE_WINDOW + 1) * interval, interval)
+            rows = [{"strike": strike, "CE": None, "PE": None, "is_atm": strike == atm} for strike in strikes]
+        self._chain_cache[key] = (now + CHAIN_CACHE_TTL, rows)
+
+        # one batched request for every CE/PE leg, then fan results back into the rows
+        data = await self.get_option_data_batch(symbol, [r["strike"] for r in rows], expiry)
+        for r in rows:
+            r["CE"] = data[(r["strike"], "CE")]
+            r["PE"] = data[(r["strike"], "PE")]
         return rows
 
-    def format_message(self, symbol: str, spot_price: float, chain):
-        ts = current_ts()
-        msg = f"🔔 *{symbol} Option Chain Update*\n"
-        msg += f"📊 *Spot Price:* ₹{spot_price:.2f}\n"
-        msg += f"⏰ *Time:* {ts}\n"
-        msg += "━━━━━━━━━━━━━━━━━━━━\n\n"
-        msg += "```\n"
-        msg += f"{'Strike':>7} {'CE LTP':>10} {'PE LTP':>10}\n"
-        msg += "-" * 35 + "\n"
+    def format_message(self, symbol: str, spot_price: float, chain, ts: str):
+        parts = [_HEADER_TEMPLATE(symbol=html.escape(symbol), spot=spot_price, ts=ts)]
+        parts_append = parts.append
         for r in chain:
-            marker = "➤" if r.get("is_atm") else " "
-            ce = r["CE"].get("ltp", 0.0) if r.get("CE") else 0.0
-            pe = r["PE"].get("ltp", 0.0) if r.get("PE") else 0.0
-            msg += f"{marker}{int(r['strike']):7d} {float(ce):10.2f} {float(pe):10.2f}\n"
-        msg += "```\n"
-        return msg
-
-    async def send_telegram(self, text: str):
-        if not bot:
+            # strikes are ints from build_option_chain's range(); leg LTPs are floats from _to_float
+            parts_append(_ROW_FMT(
+                marker="➤" if r["is_atm"] else " ",
+                strike=r["strike"],
+                ce=r["CE"]["ltp"] if r["CE"] else 0.0,
+                pe=r["PE"]["ltp"] if r["PE"] else 0.0,
+            ))
+        parts_append("</pre>\n")
+        return "".join(parts)
+
+    async def send_telegram(self, text: str, sent_mark=None):
+        """Queue text for delivery; sent_mark=(symbol, chain_hash) is recorded once it is actually sent."""
+        if not _TELEGRAM_SEND_URL:
             logger.debug("No telegram bot configured; skipping send.")
             return
-        try:
-            await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=text, parse_mode="Markdown", disable_web_page_preview=True)
-            logger.info("Telegram message sent.")
-        except Exception as e:
-            logger.warning("Failed to send Telegram message: %s", e)
+        # delivery is paced by _tg_worker so the poll loop never waits on Telegram
+        await self._tg_queue.put((text, sent_mark))
+
+    async def _send_telegram_raw(self, text: str):
+        session = await get_session()
+        payload = {**self._send_kwargs, "text": text}
+        async with session.post(_TELEGRAM_SEND_URL, json=payload) as r:
+            if r.status == 200:
+                return
+            # build our own error: aiohttp's would include the URL, and with it the bot token
+            try:
+                j = _loads(await r.read())
+            except Exception:
+                j = {}
+            if r.status == 429:
+                raise _TelegramRetryAfter((j.get("parameters") or {}).get("retry_after", 1))
+            raise _TelegramError(f"HTTP {r.status}: {j.get('description', r.reason)}")
+
+    async def _tg_worker(self):
+        interval = 1.0 / TELEGRAM_MAX_RATE
+        next_time = time.monotonic()
+        pending = None
+        while True:
+            batch = [pending if pending is not None else await self._tg_queue.get()]
+            pending = None
+            size = len(batch[0][0])
+            # coalesce anything already queued into one message, within Telegram's size limit
+            while not self._tg_queue.empty():
+                nxt = self._tg_queue.get_nowait()
+                if size + 1 + len(nxt[0]) > TELEGRAM_MAX_MESSAGE_LEN:
+                    pending = nxt
+                    break
+                batch.append(nxt)
+                size += 1 + len(nxt[0])
+            text = "\n".join(t for t, _ in batch)
+            try:
+                while True:
+                    await asyncio.sleep(max(0.0, next_time - time.monotonic()))
+                    next_time = time.monotonic() + interval
+                    try:
+                        await self._send_telegram_raw(text)
+                        logger.info("Telegram message sent.")
+                        # only delivered chains count as "last sent"; a failed send is retried next cycle
+                        for _, mark in batch:
+                            if mark is not None:
+                                self._last_msg_hash[mark[0]] = mark[1]
+                    except _TelegramRetryAfter as e:
+                        delay = float(e.retry_after)
+                        logger.warning("Telegram flood control; pausing sends for %.0fs", delay)
+                        next_time = time.monotonic() + delay
+                        continue
+                    except Exception as e:
+                        logger.warning("Failed to send Telegram message: %s", e)
+                    break
+            finally:
+                # lets stop() wait on _tg_queue.join() for everything handed to the worker
+                for _ in batch:
+                    self._tg_queue.task_done()
+
+    async def _process(self, sym: str, cfg: dict, ts: str):
+        """Fetch, build and send one symbol's chain. Returns False when no LTP could be fetched."""
+        sec = cfg.get("security_id")
+        exch = cfg.get("exchange")
+        logger.debug("Fetching LTP for %s (id=%s exch=%s)", sym, sec, exch)
+        ltp = await self.get_ltp(sec, exch)
+        if ltp is None:
+            logger.info("%s: no LTP this cycle (id=%s)", sym, sec)
+            return False
+        logger.info("%s LTP: %s", sym, ltp)
+        chain = await self.build_option_chain(sym, float(ltp))
+        # skip the send when spot and every strike's CE/PE LTP match the last message delivered for this symbol
+        h = hash((
+            f"{float(ltp):.2f}",
+            tuple((r["strike"], (r["CE"] or {}).get("ltp"), (r["PE"] or {}).get("ltp")) for r in chain),
+        ))
+        if self._last_msg_hash.get(sym) == h:
+            logger.debug("%s: option chain unchanged; not re-sending.", sym)
+            return True
+        await self.send_telegram(self.format_message(sym, float(ltp), chain, ts), sent_mark=(sym, h))
+        return True
+
+    def _record_failure(self, sym: str):
+        # exponential backoff with jitter (1s, 2s, 4s, ... capped at BACKOFF_MAX), reset on success
+        backoff = min(BACKOFF_MAX, self._backoff.get(sym, 0.5) * 2)
+        self._backoff[sym] = backoff
+        self._next_try[sym] = time.monotonic() + backoff + random.random() * 0.3 * backoff
+
+    async def _sleep_to_next_tick(self, next_tick: float) -> float:
+        """Sleep until the next POLL_INTERVAL grid point at or after next_tick; return the one after it."""
+        now = time.monotonic()
+        if next_tick <= now:
+            # cycle overran: skip the missed ticks but stay on the original grid
+            next_tick += (int((now - next_tick) // POLL_INTERVAL) + 1) * POLL_INTERVAL
+        await asyncio.sleep(next_tick - now)
+        return next_tick + POLL_INTERVAL
 
     async def poll_loop(self):
         logger.info("Starting main poll loop (interval %ss)", POLL_INTERVAL)
+        # fixed-period schedule: cycle work time is absorbed into the interval instead of added to it;
+        # jitter only offsets the grid once
+        next_tick = time.monotonic() + POLL_INTERVAL + random_jitter()
         while self.running:
             try:
-                for sym, cfg in INSTRUMENTS.items():
-                    sec = cfg.get("security_id")
-                    exch = cfg.get("exchange")
-                    logger.debug("Fetching LTP for %s (id=%s exch=%s)", sym, sec, exch)
-                    ltp = await self.get_ltp(sec, exch)
-                    if ltp is None:
-                        logger.info("%s: no LTP this cycle (id=%s)", sym, sec)
-                        continue
-                    logger.info("%s LTP: %s", sym, ltp)
-                    chain = self.build_option_chain(sym, float(ltp))
-                    msg = self.format_message(sym, float(ltp), chain)
-                    await self.send_telegram(msg)
-                # sleep + tiny jitter
-                await asyncio.sleep(POLL_INTERVAL + random_jitter())
+                # all instruments fetched concurrently; one failure doesn't block the rest.
+                # one timestamp per cycle keeps every symbol's message consistent
+                ts = current_ts()
+                now = time.monotonic()
+                # symbols still backing off after recent failures sit this cycle out
+                due = [s for s in INSTRUMENTS if self._next_try.get(s, 0.0) <= now]
+                results = await asyncio.gather(
+                    *[self._process(s, INSTRUMENTS[s], ts) for s in due],
+                    return_exceptions=True,
+                )
+                for sym, res in zip(due, results):
+                    if isinstance(res, Exception):
+                        logger.error("%s: processing failed: %s", sym, res, exc_info=res)
+                        self._record_failure(sym)
+                    elif res is False:
+                        self._record_failure(sym)
+                    else:
+                        self._backoff.pop(sym, None)
+                        self._next_try.pop(sym, None)
+                next_tick = await self._sleep_to_next_tick(next_tick)
             except asyncio.CancelledError:
                 logger.info("Poll loop cancelled.")
                 break
             except Exception as e:
                 logger.exception("Error in poll loop: %s", e)
-                await asyncio.sleep(min(60, POLL_INTERVAL))
+                if not self.running:
+                    break
+                # wait out the rest of this tick like a normal cycle, keeping the grid intact
+                next_tick = await self._sleep_to_next_tick(next_tick)
 
     async def start(self):
+        # open the shared HTTP session up front rather than on the first poll
+        await get_session()
+        self._tg_task = asyncio.create_task(self._tg_worker())
         self._task = asyncio.create_task(self.poll_loop())
 
     async def stop(self):
@@ -301,13 +654,29 @@ class OptionChainBot:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._tg_task:
+            # let already-queued updates go out before the sender is cancelled
+            if not self._tg_task.done():
+                try:
+                    await asyncio.wait_for(self._tg_queue.join(), TELEGRAM_DRAIN_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("Dropping %d unsent Telegram message(s) on shutdown.", self._tg_queue.qsize())
+            self._tg_task.cancel()
+            try:
+                await self._tg_task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Telegram sender task had failed")
+        await close_session()
         logger.info("Stopped.")
 
 # signal handlers
 def install_signal_handlers(loop, bot_obj):
     def _handle(sig):
+        # only flag the request here; main() owns the actual (awaited) shutdown
         logger.info("Signal %s received; shutting down.", sig.name)
-        asyncio.create_task(bot_obj.stop())
+        loop.call_soon_threadsafe(bot_obj._stop_requested.set)
     for s in (signal.SIGINT, signal.SIGTERM):
         try:
             loop.add_signal_handler(s, lambda s=s: _handle(s))
@@ -320,9 +689,9 @@ async def main():
     loop = asyncio.get_running_loop()
     install_signal_handlers(loop, ocb)
     await ocb.start()
-    # wait until stopped
-    while ocb.running:
-        await asyncio.sleep(1)
+    # sleep until a shutdown is requested (no periodic wakeups), then stop in order
+    await ocb._stop_requested.wait()
+    await ocb.stop()
     logger.info("Service exiting.")
 
 if __name__ == "__main__":